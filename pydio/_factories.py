@@ -13,15 +13,30 @@ from .base import IFactory
 _UNDEFINED = object()
 
 
+class _Completed:
+    """Awaitable that completes immediately with None."""
+    __slots__ = ()
+
+    def __await__(self):
+        return iter(())
+
+
+_COMPLETED = _Completed()
+
+
 class GeneratorFactory(IFactory):
+    __slots__ = ('_func', '_generator', '_instance')
     awaitable = False
 
     def __init__(self, func):
-        self._generator = func()
+        self._func = func
+        self._generator = None
         self._instance = _UNDEFINED
 
     def get_instance(self):
         if self._instance is _UNDEFINED:
+            if self._generator is None:
+                self._generator = self._func()
             self._instance = next(self._generator)
         return self._instance
 
@@ -44,66 +59,69 @@ class GeneratorFactory(IFactory):
 
 
 class AsyncGeneratorFactory(IFactory):
+    __slots__ = ('_func', '_generator', '_instance')
     awaitable = True
 
     def __init__(self, func):
-        self._generator = func()
+        self._func = func
+        self._generator = None
         self._instance = _UNDEFINED
 
     def get_instance(self):
-
-        async def async_get_instance():
-            if self._instance is _UNDEFINED:
-                self._instance = await self._generator.__anext__()
-            return self._instance
-
-        return async_get_instance()
+        return self._async_get_instance()
 
     def close(self, exc_type=None, exc=None, tb=None):
+        return self._async_close(exc_type, exc, tb)
 
-        async def async_close():
-            prev_instance = self._instance
-            self._instance = None
-            if prev_instance is not _UNDEFINED:
-                if exc_type is None:
-                    try:
-                        await self._generator.__anext__()
-                    except StopAsyncIteration:
-                        pass
-                else:
-                    try:
-                        await self._generator.athrow(exc_type, exc, tb)
-                    except StopAsyncIteration:
-                        raise exc
+    async def _async_get_instance(self):
+        if self._instance is _UNDEFINED:
+            if self._generator is None:
+                self._generator = self._func()
+            self._instance = await self._generator.__anext__()
+        return self._instance
 
-        return async_close()
+    async def _async_close(self, exc_type, exc, tb):
+        prev_instance = self._instance
+        self._instance = None
+        if prev_instance is not _UNDEFINED:
+            if exc_type is None:
+                try:
+                    await self._generator.__anext__()
+                except StopAsyncIteration:
+                    pass
+            else:
+                try:
+                    await self._generator.athrow(exc_type, exc, tb)
+                except StopAsyncIteration:
+                    raise exc
 
 
 class CoroutineFactory(IFactory):
+    __slots__ = ('_func', '_awaitable', '_instance')
     awaitable = True
 
     def __init__(self, func):
-        self._awaitable = func()
+        self._func = func
+        self._awaitable = None
         self._instance = _UNDEFINED
 
     def get_instance(self):
-
-        async def async_get_instance():
-            if self._instance is _UNDEFINED:
-                self._instance = await self._awaitable
-            return self._instance
-
-        return async_get_instance()
+        if self._instance is _UNDEFINED and self._awaitable is None:
+            self._awaitable = self._func()
+        return self._async_get_instance()
 
     def close(self, exc_type=None, exc=None, tb=None):
+        self._instance = None
+        return _COMPLETED
 
-        async def async_close():
-            self._instance = None
-
-        return async_close()
+    async def _async_get_instance(self):
+        if self._instance is _UNDEFINED:
+            self._instance = await self._awaitable
+        return self._instance
 
 
 class FunctionFactory(IFactory):
+    __slots__ = ('_instance', )
     awaitable = False
 
     def __init__(self, func):
@@ -117,6 +135,7 @@ class FunctionFactory(IFactory):
 
 
 class InstanceFactory(IFactory):
+    __slots__ = ('_value', )
     awaitable = False
 
     def __init__(self, value):
@@ -127,3 +146,12 @@ class InstanceFactory(IFactory):
 
     def close(self, exc_type=None, exc=None, tb=None):
         self._value = None
+
+
+class SharedInstanceFactory(InstanceFactory):
+    # Same as InstanceFactory, but safe to be shared by many injectors, as
+    # wrapped value is owned by provider and therefore is not cleared on close
+    __slots__ = ()
+
+    def close(self, exc_type=None, exc=None, tb=None):
+        pass
@@ -14,56 +14,116 @@ import inspect
 from . import _factories
 from .base import IUnboundFactory
 
+_INJECTABLE_PARAMS = frozenset(['injector', 'key', 'env'])
+
+# Same as inspect.CO_* constants (not visible to static analysis tools)
+_CO_GENERATOR = 0x20
+_CO_COROUTINE = 0x80
+_CO_ASYNC_GENERATOR = 0x200
+
+_POSITIONAL_KINDS = frozenset([
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+])
+
+
+def _get_injectable_params(func):
+    """Return tuple of injectable param names (in declaration order) and a
+    flag telling if those can be given positionally."""
+    params = inspect.signature(func).parameters.values()
+    names = tuple(p.name for p in params if p.name in _INJECTABLE_PARAMS)
+    leading = tuple(params)[:len(names)]
+    positional = all(
+        p.name in _INJECTABLE_PARAMS and p.kind in _POSITIONAL_KINDS
+        for p in leading
+    )
+    return names, positional
+
+
+def _get_code_flags(func):
+    """Return code object flags of given function, looking through bound
+    methods and partials (like the :mod:`inspect` predicates do), or 0 if
+    there is no code object."""
+    while True:
+        code = getattr(func, '__code__', None)
+        if code is not None:
+            return code.co_flags
+        if isinstance(func, functools.partial):
+            func = func.func
+        elif inspect.ismethod(func):
+            func = func.__func__
+        else:
+            return 0
+
+
+def _get_factory_class_for(func):
+    flags = _get_code_flags(func)
+    if flags & _CO_ASYNC_GENERATOR:
+        return _factories.AsyncGeneratorFactory
+    if flags & _CO_COROUTINE:
+        return _factories.CoroutineFactory
+    if flags & _CO_GENERATOR:
+        return _factories.GeneratorFactory
+    return _factories.FunctionFactory
+
 
 class UnboundFunctionFactory(IUnboundFactory):
+    __slots__ = (
+        '_factory_class', '_awaitable', '_key', '_func', '_scope', '_env',
+        '_make_partial'
+    )
 
     def __init__(self, func, key, scope=None, env=None):  # pylint: disable=too-many-arguments
-        self._factory_class = self.__get_factory_class_for(func)
+        self._factory_class = _get_factory_class_for(func)
+        self._awaitable = self._factory_class.awaitable
         self._key = key
         self._func = func
-        self._func_params = inspect.signature(func).parameters
         self._scope = scope
         self._env = env
-
-    @staticmethod
-    def __get_factory_class_for(func):
-        if inspect.isasyncgenfunction(func):
-            return _factories.AsyncGeneratorFactory
-        if inspect.iscoroutinefunction(func):
-            return _factories.CoroutineFactory
-        if inspect.isgeneratorfunction(func):
-            return _factories.GeneratorFactory
-        return _factories.FunctionFactory
+        self._make_partial = self.__get_partial_maker(func, key, env)
 
     @property
     def scope(self):
         return self._scope
 
     def is_awaitable(self):
-        return self._factory_class.awaitable
+        return self._awaitable
 
     def bind(self, injector):
-        return self._factory_class(self.__make_partial(injector))
+        return self._factory_class(self._make_partial(injector))
 
-    def __make_partial(self, injector):
+    @staticmethod
+    def __get_partial_maker(func, key, env):
         # TODO: Current implementation requires factory functions to use args
         # with forced name. Although those params can be given in any order, I
         # would like to rewrite this part to allow matching by annotation, so
         # different names could be used
-        kwargs = {}
-        if 'injector' in self._func_params:
-            kwargs['injector'] = injector
-        if 'key' in self._func_params:
-            kwargs['key'] = self._key
-        if 'env' in self._func_params:
-            kwargs['env'] = self._env
-        return functools.partial(self._func, **kwargs)
+        names, positional = _get_injectable_params(func)
+        if not names:
+            return lambda injector: func
+        values = {'key': key, 'env': env}
+        if positional and names == ('injector', ):
+            return functools.partial(functools.partial, func)
+        if positional and names[:1] == ('injector', ):
+            args = tuple(values[name] for name in names[1:])
+            return lambda injector: functools.partial(func, injector, *args)
+        if positional and 'injector' not in names:
+            partial = functools.partial(func, *(values[name] for name in names))
+            return lambda injector: partial
+        kwargs = {name: values[name] for name in names if name != 'injector'}
+        if 'injector' not in names:
+            partial = functools.partial(func, **kwargs)
+            return lambda injector: partial
+        return lambda injector: functools.partial(
+            func, injector=injector, **kwargs
+        )
 
 
 class UnboundInstanceFactory(IUnboundFactory):
+    __slots__ = ('_factory', '_scope', '_env')
 
     def __init__(self, value, scope=None, env=None):
-        self._value = value
+        self._factory = _factories.SharedInstanceFactory(value)
         self._scope = scope
         self._env = env
 
@@ -76,4 +136,4 @@ class UnboundInstanceFactory(IUnboundFactory):
 
     def bind(self, *args):
         del args
-        return _factories.InstanceFactory(self._value)
+        return self._factory
@@ -19,12 +19,39 @@ this instead:
     from pydio.api import Injector, Provider
 """
 
-from .injector import Injector
-from .keys import Variant
-from .provider import Provider
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .injector import Injector
+    from .keys import Variant
+    from .provider import Provider
 
 __all__ = [
     'Injector',
     'Provider',
     'Variant',
 ]
+
+_MODULES = {
+    'Injector': '.injector',
+    'Provider': '.provider',
+    'Variant': '.keys',
+}
+
+
+def __getattr__(name):
+    # Submodules are imported on first access, so importing this module does
+    # not pull in the parts of the library that are not used
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -11,19 +11,37 @@
 """Interface definitions."""
 
 import abc
-import contextlib
 import typing
 from typing import Awaitable, Hashable, Optional, TypeVar, Union
 
-from . import _compat
-
 T = TypeVar('T')
 
 
-class IInjector(
-    contextlib.AbstractContextManager, _compat.AbstractAsyncContextManager
-):
-    """Definition of injector interface."""
+class IInjector(abc.ABC):
+    """Definition of injector interface.
+
+    Injectors are both sync and async context managers.
+
+    .. versionchanged:: 0.4.2
+        No longer derives from :class:`contextlib.AbstractContextManager` and
+        :class:`contextlib.AbstractAsyncContextManager`; the context manager
+        protocol is defined here directly.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    @abc.abstractmethod
+    def __exit__(self, exc_type, exc, tb):
+        """Exit the runtime context and close this injector."""
+
+    async def __aenter__(self):
+        return self
+
+    @abc.abstractmethod
+    async def __aexit__(self, exc_type, exc, tb):
+        """Exit the async runtime context and close this injector."""
 
     @abc.abstractmethod
     def inject(self, key: Hashable) -> Union[T, Awaitable[T]]:
@@ -90,6 +108,13 @@ class IFactory(abc.ABC):
     .. deprecated:: 0.4.0
         This will be removed from the public interface.
     """
+    __slots__ = ()
+
+    #: True if :meth:`get_instance` and :meth:`close` return awaitables or
+    #: False otherwise.
+    #:
+    #: .. versionadded:: 0.4.2
+    awaitable: bool = False
 
     @abc.abstractmethod
     def get_instance(self) -> Optional[Union[T, Awaitable[T]]]:
@@ -150,6 +175,7 @@ class IUnboundFactory(abc.ABC):
     .. deprecated:: 0.4.0
         This will be removed from the public interface.
     """
+    __slots__ = ()
 
     @property
     @abc.abstractmethod
@@ -184,6 +210,7 @@ class IUnboundFactoryRegistry(abc.ABC):
     .. deprecated:: 0.4.0
         This will be removed from the public interface.
     """
+    __slots__ = ()
 
     @abc.abstractmethod
     def get(self,
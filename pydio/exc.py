@@ -11,6 +11,7 @@
 """Base exception classes for PyDio."""
 
 import abc
+from typing import Hashable
 
 
 class Base(Exception, abc.ABC):
@@ -22,10 +23,13 @@ class Base(Exception, abc.ABC):
 
     def __init__(self, **kwargs):
         super().__init__()
-        self._params = dict(kwargs)
+        self._params = kwargs
+        self._message = None
 
     def __str__(self):
-        return self.message_template.format(self=self)
+        if self._message is None:
+            self._message = self.message_template.format(self=self)
+        return self._message
 
     @property
     @abc.abstractmethod
@@ -58,3 +62,94 @@ class InjectorError(Base):
 class ProviderError(Base):
     """Base class for exceptions that can be raised by
     :class:`pydio.base.IUnboundFactoryRegistry` instances."""
+
+
+class NoProviderFoundError(InjectorError):
+    """Raised when there was no matching provider found for given key.
+
+    :param key:
+        Searched key
+
+    :param env:
+        Searched environment
+
+    .. versionchanged:: 0.4.2
+        Moved here from :class:`pydio.injector.Injector`, where it is still
+        available as an alias.
+    """
+    message_template = "No provider found for: key={self.key!r}, env={self.env!r}"
+
+    key: Hashable
+    env: Hashable
+
+    def __init__(self, key, env):
+        super().__init__(key=key, env=env)
+        self.key = key
+        self.env = env
+
+
+class OutOfScopeError(InjectorError):
+    """Raised when there was attempt to create object that was registered
+    for different scope.
+
+    :param key:
+        Searched key
+
+    :param scope:
+        Injector's own scope
+
+    :param required_scope:
+        Required scope
+
+    .. versionchanged:: 0.4.2
+        Moved here from :class:`pydio.injector.Injector`, where it is still
+        available as an alias.
+    """
+    message_template =\
+        "Cannot inject {self.key!r} due to scope mismatch: "\
+        "{self.required_scope!r} (required) != {self.scope!r} (owned)"
+
+    key: Hashable
+    scope: Hashable
+    required_scope: Hashable
+
+    def __init__(self, key, scope, required_scope):
+        super().__init__(key=key, scope=scope, required_scope=required_scope)
+        self.key = key
+        self.scope = scope
+        self.required_scope = required_scope
+
+
+class AlreadyClosedError(InjectorError):
+    """Raised when operation on a closed injector was performed.
+
+    .. versionchanged:: 0.4.2
+        Moved here from :class:`pydio.injector.Injector`, where it is still
+        available as an alias.
+    """
+    message_template = "This injector was already closed"
+
+
+class DoubleRegistrationError(ProviderError):
+    """Raised when same ``(key, env)`` tuple was used twice during
+    registration.
+
+    :param key:
+        Registered key
+
+    :param env:
+        Registered environment
+
+    .. versionchanged:: 0.4.2
+        Moved here from :class:`pydio.provider.Provider`, where it is still
+        available as an alias.
+    """
+    message_template = "Cannot register twice for: key={self.key!r}, env={self.env!r}"
+
+    key: Hashable
+    env: Hashable
+
+    def __init__(self, key, env):
+        super().__init__(key=key, env=env)
+        self.key = key
+        self.env = env
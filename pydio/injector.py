@@ -9,15 +9,46 @@
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
 import asyncio
-import inspect
 import threading
+import types
 import typing
-import weakref
 from typing import Awaitable, Hashable, Optional
 
 from . import exc
 from .base import IFactory, IInjector, IUnboundFactoryRegistry
 
+# Shared by all injectors until first write, so injectors that never create
+# anything (or never have children) do not allocate containers of their own
+_EMPTY_CACHE: typing.Mapping[typing.Any, IFactory] = types.MappingProxyType({})
+_EMPTY_SET: typing.AbstractSet[typing.Any] = frozenset()
+
+
+class _NullLock:
+    """Lock that does nothing; used by injectors that are not thread-safe."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+
+_NULL_LOCK = _NullLock()
+
+_get_ident = threading.get_ident
+
+
+async def _async_noop():
+    pass
+
+
+def _discard(maybe_coroutine):
+    # Close coroutine that will never be awaited, so it does not emit
+    # "coroutine was never awaited" warning
+    if isinstance(maybe_coroutine, types.CoroutineType):
+        maybe_coroutine.close()
+
 
 class Injector(IInjector):
     """Dependency injector main class.
@@ -34,15 +65,30 @@ class Injector(IInjector):
 
         See :meth:`IUnboundFactoryRegistry.get` for more details.
     """
+    __slots__ = (
+        '_provider', '_env', '_cache', '_inherited_keys', '_lock', '_pending',
+        '_waiters', '_scope', '_child_injectors', '_parent', '__weakref__'
+    )
+
+    #: Set to False in a subclass to disable locking in injectors that are
+    #: only used by a single thread (f.e. in asyncio-only applications).
+    #:
+    #: .. versionadded:: 0.4.2
+    thread_safe: bool = True
 
     def __init__(self, provider: IUnboundFactoryRegistry, env: Hashable = None):
         self._provider = provider
         self._env = env
-        self._cache: typing.Dict[typing.Any, IFactory] = {}
-        self._lock = threading.RLock()
+        self._cache = _EMPTY_CACHE
+        self._inherited_keys: typing.AbstractSet[typing.Any] = _EMPTY_SET
+        self._lock = threading.RLock() if self.thread_safe else _NULL_LOCK
+        self._pending: typing.Mapping[typing.Any, int] = _EMPTY_CACHE
+        self._waiters: typing.Optional[threading.Condition] = None
         self._scope = None
-        self._child_injectors: typing.List[Injector] = []
-        self.__parent = None
+        # Used as an ordered set; children remove themselves when closed, so
+        # this does not grow for parents creating many short-lived children
+        self._child_injectors: typing.Mapping[Injector, None] = _EMPTY_CACHE
+        self._parent: typing.Optional[Injector] = None
 
     def __exit__(self, exc_type, exc, tb):
         if exc_type is None:
@@ -52,21 +98,11 @@ class Injector(IInjector):
 
     async def __aexit__(self, exc_type, exc, tb):
         if exc_type is None:
-            maybe_coroutine = self.close()
+            maybe_awaitable = self.close()
         else:
-            maybe_coroutine = self._do_close(exc_type, exc, tb)
-        if inspect.iscoroutine(maybe_coroutine):
-            await maybe_coroutine
-
-    @property
-    def _parent(self):
-        if self.__parent is not None:
-            return self.__parent()
-        return None
-
-    @_parent.setter
-    def _parent(self, value):
-        self.__parent = weakref.ref(value)
+            maybe_awaitable = self._do_close(exc_type, exc, tb)
+        if maybe_awaitable is not None:
+            await maybe_awaitable
 
     @property
     def env(self) -> Optional[Hashable]:
@@ -75,40 +111,158 @@ class Injector(IInjector):
 
     def inject(self, key):
         """See :class:`IInjector.inject`."""
-        if key in self._cache:
-            return self._cache[key].get_instance()
+        factory = self._cache.get(key)
+        if factory is not None:
+            return factory.get_instance()
+        return self._inject_slow(key)[1]
+
+    def _inject_slow(self, key):
+        # Returns both factory and the instance it created, so descendants
+        # can reuse factory without reading this injector's cache again
         with self._lock:
-            if self.is_closed():
+            if self._provider is None:
+                raise self.AlreadyClosedError()
+            factory = self._cache.get(key)
+            if factory is None:
+                # Mark key as being created by current thread; other threads
+                # wait for it, while threads creating other keys are not
+                # blocked at all
+                pending = self._pending
+                if key in pending:
+                    factory = self._wait_for(key)
+                else:
+                    if pending is _EMPTY_CACHE:
+                        pending = self._pending = {}
+                    pending[key] = _get_ident()
+        if factory is not None:
+            return factory, factory.get_instance()
+        try:
+            factory, instance, inherited = self._resolve(key)
+        except BaseException:
+            with self._lock:
+                self._unclaim(key)
+            raise
+        self._store(key, factory, instance, inherited)
+        return factory, instance
+
+    def _wait_for(self, key):
+        # Must be called with the lock held, when given key is pending.
+        # Returns factory created by other thread, or None once given key is
+        # marked as being created by current thread
+        ident = _get_ident()
+        while True:
+            creator = self._pending.get(key)
+            if creator is None:
+                self._pending[key] = ident
+                return None
+            if creator == ident:
+                return None
+            if self._waiters is None:
+                self._waiters = threading.Condition(self._lock)
+            self._waiters.wait()
+            if self._provider is None:
                 raise self.AlreadyClosedError()
-            if key in self._cache:
-                return self._cache[key].get_instance()
-            unbound_instance = self._provider.get(key, self._env)
-            if unbound_instance is None:
-                raise self.NoProviderFoundError(key=key, env=self._env)
-            if unbound_instance.scope != self._scope:
-                if self._parent is not None:
-                    return self._parent.inject(key)
-                raise self.OutOfScopeError(
-                    key=key,
-                    scope=self._scope,
-                    required_scope=unbound_instance.scope,
-                )
-            instance = unbound_instance.bind(self)
-            self._cache[key] = instance
-            return instance.get_instance()
+            factory = self._cache.get(key)
+            if factory is not None:
+                return factory
+
+    def _unclaim(self, key):
+        # Must be called with the lock held
+        self._pending.pop(key, None)
+        if self._waiters is not None:
+            self._waiters.notify_all()
+
+    def _resolve(self, key):
+        provider = self._provider
+        if provider is None:
+            raise self.AlreadyClosedError()
+        env = self._env
+        scope = self._scope
+        unbound_instance = provider.get(key, env)
+        if unbound_instance is None:
+            raise self.NoProviderFoundError(key=key, env=env)
+        required_scope = unbound_instance.scope
+        if required_scope != scope:
+            owner = self._parent
+            while owner is not None and owner._scope != required_scope:  # pylint: disable=protected-access
+                owner = owner._parent  # pylint: disable=protected-access
+            if owner is not None:
+                # Remember factory owned by ancestor, so next time this
+                # key is injected the parent chain is not walked again
+                factory, instance = owner._inject_slow(key)  # pylint: disable=protected-access
+                return factory, instance, True
+            raise self.OutOfScopeError(
+                key=key,
+                scope=scope,
+                required_scope=required_scope,
+            )
+        factory = unbound_instance.bind(self)
+        return factory, factory.get_instance(), False
+
+    def batch_inject(self, keys: typing.Iterable[Hashable]) -> list:
+        """Inject objects for each of given keys.
+
+        This works same as calling :meth:`inject` for each key, but cache
+        lookups are done in a single loop. Returned list contains results in
+        same order as keys were given. Results of awaitable factories are
+        returned as awaitables, exactly as :meth:`inject` does.
+
+        .. versionadded:: 0.4.2
+        """
+        cache = self._cache
+        out = []
+        for key in keys:
+            factory = cache.get(key)
+            if factory is None:
+                out.append(self.inject(key))
+                cache = self._cache
+            else:
+                out.append(factory.get_instance())
+        return out
+
+    def _store(self, key, factory, instance, inherited=False):
+        with self._lock:
+            self._pending.pop(key, None)
+            if self._waiters is not None:
+                self._waiters.notify_all()
+            # Injector could have been closed while the factory was being
+            # created; it would never be closed if stored in the cache now
+            if self._provider is None:
+                if not inherited:
+                    _discard(factory.close())
+                _discard(instance)
+                raise self.AlreadyClosedError()
+            if self._cache is _EMPTY_CACHE:
+                self._cache = {}
+            self._cache[key] = factory
+            if inherited:
+                if self._inherited_keys is _EMPTY_SET:
+                    self._inherited_keys = set()
+                self._inherited_keys.add(key)
 
     def scoped(self, scope: Hashable, env: Hashable = None) -> IInjector:
-        """See :meth:`pydio.base.IInjector.scoped`."""
-        if env is not None:
-            parent_env = self._env
-            if parent_env is not None and parent_env != env:
-                raise ValueError(
-                    "scoped() got an invalid value for parameter 'env': expected {!r} or None, got {!r}"
-                    .format(parent_env, env)
-                )
+        """See :meth:`pydio.base.IInjector.scoped`.
+
+        .. versionchanged:: 0.4.2
+            Closed scoped injectors are no longer referenced by their parent.
+            Raises :exc:`pydio.exc.AlreadyClosedError` if called on closed
+            injector.
+        """
+        parent_env = self._env
+        if env is None:
+            env = parent_env
+        elif parent_env is not None and parent_env != env:
+            raise ValueError(
+                "scoped() got an invalid value for parameter 'env': expected {!r} or None, got {!r}"
+                .format(parent_env, env)
+            )
         with self._lock:
-            injector = self.__class__(self._provider, env=env or self._env)
-            self._child_injectors.append(injector)
+            if self.is_closed():
+                raise self.AlreadyClosedError()
+            injector = self.__class__(self._provider, env=env)
+            if self._child_injectors is _EMPTY_CACHE:
+                self._child_injectors = {}
+            self._child_injectors[injector] = None
             injector._parent = self  # pylint: disable=protected-access
             injector._scope = scope  # pylint: disable=protected-access
             return injector
@@ -121,97 +275,76 @@ class Injector(IInjector):
                   exc_type=None,
                   exc=None,
                   tb=None) -> Optional[Awaitable[None]]:
-        if self._provider is not None:
-            with self._lock:
-                provider = self._provider
-                awaitables = []
-                for child in self._child_injectors:
-                    maybe_awaitable = child._do_close(exc_type, exc, tb)
-                    if maybe_awaitable is not None:
-                        awaitables.append(maybe_awaitable)
-                first_exc_raised = None
-                for instance in self._cache.values():
-                    try:
-                        maybe_awaitable = instance.close(exc_type, exc, tb)
-                        if maybe_awaitable is not None:
-                            awaitables.append(maybe_awaitable)
-                    except Exception as e:
-                        if first_exc_raised is None:
-                            first_exc_raised = e
-                if not provider.has_awaitables():
-                    self._provider = None
-                    if first_exc_raised is not None:
-                        raise first_exc_raised
-                else:
-
-                    async def do_async_close(awaitables):
-                        self._provider = None
-                        await asyncio.gather(*awaitables)
-                        if first_exc_raised is not None:
-                            raise first_exc_raised
-
-                    return do_async_close(awaitables)
+        provider = self._provider
+        if provider is None:
+            return None
+        parent = self._parent
+        if parent is not None:
+            # Done before taking own lock, as parent closing its children
+            # takes the locks in reverse order
+            with parent._lock:  # pylint: disable=protected-access
+                siblings = parent._child_injectors  # pylint: disable=protected-access
+                if self in siblings:
+                    del siblings[self]
+        with self._lock:
+            provider = self._provider
+            if provider is None:
+                return None
+            if not self._cache and not self._child_injectors:
+                # Nothing was created by this injector, so there is nothing
+                # to close; skip collecting awaitables
+                self._provider = None
+                return _async_noop() if provider.has_awaitables() else None
+            # Results are collected unconditionally and filtered only if
+            # provider has awaitables, as sync factories always return None
+            results = [
+                child._do_close(exc_type, exc, tb)
+                for child in list(self._child_injectors)
+            ]
+            inherited_keys = self._inherited_keys
+            first_exc_raised = None
+            for key, factory in self._cache.items():
+                if key in inherited_keys:
+                    continue
+                try:
+                    results.append(factory.close(exc_type, exc, tb))
+                except Exception as e:
+                    if first_exc_raised is None:
+                        first_exc_raised = e
+            if not provider.has_awaitables():
+                self._release()
+                if first_exc_raised is not None:
+                    raise first_exc_raised
+                return None
+            awaitables = [x for x in results if x is not None]
+            if not awaitables and first_exc_raised is None:
+                self._release()
+                return _async_noop()
+
+            async def do_async_close(awaitables):
+                with self._lock:
+                    self._release()
+                await asyncio.gather(*awaitables)
+                if first_exc_raised is not None:
+                    raise first_exc_raised
+
+            return do_async_close(awaitables)
+
+    def _release(self):
+        # Mark as closed and drop references to factories and children, so
+        # those can be freed even if this injector is still referenced
+        self._provider = None
+        self._cache = _EMPTY_CACHE
+        self._inherited_keys = _EMPTY_SET
+        self._child_injectors = _EMPTY_CACHE
+        if self._waiters is not None:
+            # Wake up threads waiting for objects that will never be created
+            self._waiters.notify_all()
 
     def is_closed(self) -> bool:
         """Return True if this injector was closed or False otherwise."""
         return self._provider is None
 
-    class NoProviderFoundError(exc.InjectorError):
-        """Raised when there was no matching provider found for given key.
-
-        :param key:
-            Searched key
-
-        :param env:
-            Searched environment
-        """
-        message_template = "No provider found for: key={self.key!r}, env={self.env!r}"
-
-        def __init__(self, key, env):
-            super().__init__(key=key, env=env)
-
-        @property
-        def key(self) -> Hashable:
-            return self.params['key']
-
-        @property
-        def env(self) -> Hashable:
-            return self.params['env']
-
-    class OutOfScopeError(exc.InjectorError):
-        """Raised when there was attempt to create object that was registered
-        for different scope.
-
-        :param key:
-            Searched key
-
-        :param scope:
-            Injector's own scope
-
-        :param required_scope:
-            Required scope
-        """
-        message_template =\
-            "Cannot inject {self.key!r} due to scope mismatch: "\
-            "{self.required_scope!r} (required) != {self.scope!r} (owned)"
-
-        def __init__(self, key, scope, required_scope):
-            super().__init__(
-                key=key, scope=scope, required_scope=required_scope
-            )
-
-        @property
-        def key(self) -> Hashable:
-            return self.params['key']
-
-        @property
-        def scope(self) -> Hashable:
-            return self.params['scope']
-
-        @property
-        def required_scope(self) -> Hashable:
-            return self.params['required_scope']
-
-    class AlreadyClosedError(exc.InjectorError):
-        """Raised when operation on a closed injector was performed."""
-        message_template = "This injector was already closed"
+    NoProviderFoundError = exc.NoProviderFoundError
+    OutOfScopeError = exc.OutOfScopeError
+    AlreadyClosedError = exc.AlreadyClosedError
@@ -8,11 +8,10 @@
 #
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
-import collections.abc
 from typing import Hashable
 
 
-class Variant(collections.abc.Hashable):
+class Variant:
     """A special form of key that can have user-defined parameters attached.
 
     This class can be used if you need to use same key twice, but return
@@ -24,11 +23,18 @@ class Variant(collections.abc.Hashable):
 
     :param kwargs:
         Additional parameters to be bound with given key
+
+    .. versionchanged:: 0.4.2
+        Parameter values are now included in the hash, which is computed once
+        in constructor, so all values given via **kwargs** must be hashable;
+        passing unhashable value (f.e. a list) raises :exc:`TypeError`.
     """
+    __slots__ = ('_key', '_items', '_hash')
 
     def __init__(self, key: Hashable, **kwargs: Hashable):
         self._key = key
-        self._kwargs = kwargs
+        self._items = tuple(sorted(kwargs.items()))
+        self._hash = hash((key, self._items))
 
     @property
     def key(self):
@@ -37,21 +43,26 @@ class Variant(collections.abc.Hashable):
 
     @property
     def kwargs(self) -> dict:
-        """Dict with parameters given in constructor."""
-        return self._kwargs
+        """Dict with parameters given in constructor.
+
+        .. versionchanged:: 0.4.2
+            Each access returns a new dict with parameters sorted by name.
+        """
+        return dict(self._items)
 
     def __repr__(self):
-        return "<Variant(key={self._key!r}, kwargs={self._kwargs!r})>".format(
+        return "<Variant(key={self._key!r}, kwargs={self.kwargs!r})>".format(
             self=self
         )
 
     def __hash__(self):
-        return hash(self._key)
+        return self._hash
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and\
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._hash == other._hash and\
             self._key == other._key and\
-            self._kwargs == other._kwargs
-
-    def __ne__(self, other):
-        return not self.__eq__(other)
+            self._items == other._items
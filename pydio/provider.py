@@ -9,11 +9,14 @@
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
 import threading
-from typing import Hashable
 
 from . import _unbound_factories, exc
 from .base import IUnboundFactoryRegistry
 
+# Max number of (key, env) lookups remembered by a provider; oldest entries
+# are dropped first
+_LOOKUP_CACHE_SIZE = 1024
+
 
 class Provider(IUnboundFactoryRegistry):
     """Used to record user-defined object factories or instances and bind
@@ -23,32 +26,33 @@ class Provider(IUnboundFactoryRegistry):
     def __init__(self):
         self._lock = threading.Lock()
         self._unbound_factories = {}
+        self._lookup_cache = {}
+        self._awaitable_count = 0
 
     def _check_key_availability(self, key, env):
-        found = self._unbound_factories.get(key, {}).get(env)
-        if found is not None:
+        if (key, env) in self._unbound_factories:
             raise self.DoubleRegistrationError(key=key, env=env)
 
-    def _iter_factory_funcs(self):
-        for envs in self._unbound_factories.values():
-            for unbound_factory in envs.values():
-                yield unbound_factory
-
     def get(self, key, env=None):
         """See :meth:`IUnboundFactoryRegistry.get`."""
+        try:
+            return self._lookup_cache[key, env]
+        except KeyError:
+            pass
         with self._lock:
-            envs = self._unbound_factories.get(key, {})
-            found = envs.get(env)
+            found = self._unbound_factories.get((key, env))
             if found is None and env is not None:
-                return envs.get(None)
+                found = self._unbound_factories.get((key, None))
+            if found is not None:
+                lookup_cache = self._lookup_cache
+                if len(lookup_cache) >= _LOOKUP_CACHE_SIZE:
+                    del lookup_cache[next(iter(lookup_cache))]
+                lookup_cache[key, env] = found
             return found
 
     def has_awaitables(self):
         """See :meth:`IUnboundFactoryRegistry.has_awaitables`."""
-        with self._lock:
-            return any(
-                factory.is_awaitable() for factory in self._iter_factory_funcs()
-            )
+        return self._awaitable_count > 0
 
     def attach(self, provider: 'Provider'):
         """Attach given provider to this provider.
@@ -59,11 +63,17 @@ class Provider(IUnboundFactoryRegistry):
         Use this if you need to split your providers across multiple modules.
         """
         with self._lock:
-            for key, envs in provider._unbound_factories.items():  # pylint: disable=protected-access
-                for env, unbound_factory in envs.items():
+            other = provider._unbound_factories  # pylint: disable=protected-access
+            try:
+                for (key, env), unbound_factory in other.items():
                     self._check_key_availability(key, env)
-                    self._unbound_factories.setdefault(key, {}
-                                                       )[env] = unbound_factory
+                    self._unbound_factories[key, env] = unbound_factory
+                    if unbound_factory.is_awaitable():
+                        self._awaitable_count += 1
+            finally:
+                # Factories attached before a failure are kept, so cached
+                # lookups may be outdated in both cases
+                self._lookup_cache.clear()
 
     def register_func(self, key, func, scope=None, env=None):
         """Register user factory function.
@@ -87,8 +97,13 @@ class Provider(IUnboundFactoryRegistry):
         """
         with self._lock:
             self._check_key_availability(key, env)
-            self._unbound_factories.setdefault(key, {})[env] =\
-                _unbound_factories.UnboundFunctionFactory(func, key, scope=scope, env=env)
+            unbound_factory = _unbound_factories.UnboundFunctionFactory(
+                func, key, scope=scope, env=env
+            )
+            self._unbound_factories[key, env] = unbound_factory
+            if unbound_factory.is_awaitable():
+                self._awaitable_count += 1
+            self._lookup_cache.clear()
 
     def register_instance(self, key, value, scope=None, env=None):
         """Same as :meth:`register_func`, but for registration of constant
@@ -99,8 +114,9 @@ class Provider(IUnboundFactoryRegistry):
         """
         with self._lock:
             self._check_key_availability(key, env)
-            self._unbound_factories.setdefault(key, {})[env] =\
+            self._unbound_factories[key, env] =\
                 _unbound_factories.UnboundInstanceFactory(value, scope=scope, env=env)
+            self._lookup_cache.clear()
 
     def provides(self, key, scope=None, env=None):
         """Same as :meth:`register_func`, but to be used as a decorator.
@@ -124,25 +140,4 @@ class Provider(IUnboundFactoryRegistry):
 
         return decorator
 
-    class DoubleRegistrationError(exc.ProviderError):
-        """Raised when same ``(key, env)`` tuple was used twice during
-        registration.
-
-        :param key:
-            Registered key
-
-        :param env:
-            Registered environment
-        """
-        message_template = "Cannot register twice for: key={self.key!r}, env={self.env!r}"
-
-        def __init__(self, key, env):
-            super().__init__(key=key, env=env)
-
-        @property
-        def key(self) -> Hashable:
-            return self.params['key']
-
-        @property
-        def env(self) -> Hashable:
-            return self.params['env']
+    DoubleRegistrationError = exc.DoubleRegistrationError
@@ -59,3 +59,35 @@ class TestBasics:
         injector.close()
         with pytest.raises(Injector.AlreadyClosedError):
             injector.inject(IFoo)
+
+    def test_objects_created_before_close_are_no_longer_injected_after_close(
+        self, injector
+    ):
+        injector.inject(IFoo)
+        injector.close()
+        with pytest.raises(Injector.AlreadyClosedError):
+            injector.inject(IFoo)
+
+    def test_closed_injector_cannot_create_scoped_injectors(self, injector):
+        injector.close()
+        with pytest.raises(Injector.AlreadyClosedError):
+            injector.scoped('foo')
+
+    def test_injector_can_inject_many_objects_at_once(self, injector):
+        foo = injector.inject(IFoo)
+        result = injector.batch_inject([IFoo, IBar, IFoo])
+        assert result[0] is foo
+        assert isinstance(result[1], Bar)
+        assert result[2] is foo
+
+    def test_injector_without_thread_safety_works_the_same(self):
+
+        class UnsafeInjector(Injector):
+            thread_safe = False
+
+        injector = UnsafeInjector(provider)
+        foo = injector.inject(IFoo)
+        assert injector.inject(IFoo) is foo
+        injector.close()
+        with pytest.raises(Injector.AlreadyClosedError):
+            injector.inject(IBar)
@@ -8,6 +8,8 @@
 #
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
+import asyncio
+
 import pytest
 from mockify.actions import Return
 from mockify.core import satisfied
@@ -62,3 +64,39 @@ class TestCoroutineBasedProvider:
         connection.close.expect_call().times(1)
         with satisfied(connection):
             await injector.close()
+
+    @pytest.mark.asyncio
+    async def test_when_only_sync_objects_were_created_then_injector_is_closed_without_awaiting(
+        self, injector
+    ):
+        connection = Mock('connection')
+        database = injector.inject('database')
+        database.connect.expect_call().will_once(Return(connection))
+        with satisfied(database):
+            assert injector.inject('connection') is connection
+        connection.close.expect_call().times(1)
+        with satisfied(connection):
+            coroutine = injector.close()
+        assert injector.is_closed()
+        await asyncio.create_task(coroutine)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_injection_stops_factory_coroutine(self):
+        steps = []
+        other = Provider()
+
+        @other.provides('slow')
+        async def make_slow():
+            steps.append('started')
+            await asyncio.sleep(10)
+            steps.append('finished')
+
+        injector = Injector(other)
+        task = asyncio.ensure_future(injector.inject('slow'))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await injector.close()
+        await asyncio.sleep(0)
+        assert steps == ['started']
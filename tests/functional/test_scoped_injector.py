@@ -8,6 +8,9 @@
 #
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
+import gc
+import weakref
+
 import pytest
 from mockify.actions import Return
 from mockify.core import satisfied
@@ -81,8 +84,10 @@ class TestScopedInjector:
         self, injector
     ):
         sc1 = injector.scoped('sc1')
-        with pytest.raises(Injector.OutOfScopeError):
+        with pytest.raises(Injector.OutOfScopeError) as excinfo:
             sc1.inject('baz')
+        assert excinfo.value.scope == 'sc1'
+        assert excinfo.value.required_scope == 'sc2'
 
     def test_scoped_injector_can_inject_objects_from_any_parent_scopes(
         self, injector
@@ -122,3 +127,41 @@ class TestScopedInjector:
         connection.close.expect_call().times(1)
         with satisfied(connection):
             injector.close()
+
+    def test_objects_injected_from_parent_are_not_cleared_when_child_is_closed(
+        self, injector
+    ):
+        sc1 = injector.scoped('sc1')
+        foo = sc1.inject(IFoo)
+        assert sc1.inject(IFoo) is foo
+        sc1.close()
+        assert injector.inject(IFoo) is foo
+
+    def test_parent_injector_does_not_keep_closed_child_injectors_alive(
+        self, injector
+    ):
+        sc1 = injector.scoped('sc1')
+        sc1_ref = weakref.ref(sc1)
+        sc1.close()
+        del sc1
+        gc.collect()
+        assert sc1_ref() is None
+
+    def test_when_parent_injector_is_closed_then_unreferenced_child_injectors_are_closed_as_well(
+        self, injector
+    ):
+        connection = Mock('connection')
+        db = injector.inject('db')
+        db.connect.expect_call().will_once(Return(connection))
+        with satisfied(db):
+            assert injector.scoped('sc1').inject('connection') is connection
+        gc.collect()
+
+        connection.close.expect_call().times(1)
+        with satisfied(connection):
+            injector.close()
+
+    def test_child_injector_keeps_its_parent_alive(self):
+        sc1 = Injector(provider).scoped('sc1')
+        gc.collect()
+        assert isinstance(sc1.inject(IFoo), Foo)
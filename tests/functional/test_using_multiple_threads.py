@@ -48,3 +48,93 @@ def test_factory_function_is_called_once_for_multiple_threads():
         thread.join()
 
     assert count == len(string.ascii_uppercase)
+
+
+def test_slow_factory_does_not_block_injection_of_other_keys():
+
+    def make_slow():
+        slow_started.set()
+        if not fast_injected.wait(timeout=5):
+            raise TimeoutError()
+        return 'slow'
+
+    slow_started = threading.Event()
+    fast_injected = threading.Event()
+    provider = Provider()
+    provider.register_func('slow', make_slow)
+    provider.register_instance('fast', 'fast')
+    injector = Injector(provider)
+    result = []
+
+    thread = threading.Thread(
+        target=lambda: result.append(injector.inject('slow'))
+    )
+    thread.start()
+    assert slow_started.wait(timeout=5)
+    assert injector.inject('fast') == 'fast'
+    fast_injected.set()
+    thread.join()
+
+    assert result == ['slow']
+
+
+def test_object_created_while_injector_was_being_closed_is_closed_as_well():
+
+    def make_connection():
+        connection_started.set()
+        if not injector_closed.wait(timeout=5):
+            raise TimeoutError()
+        yield 'connection'
+        teardown.append('connection')
+
+    connection_started = threading.Event()
+    injector_closed = threading.Event()
+    teardown = []
+    provider = Provider()
+    provider.register_func('connection', make_connection)
+    injector = Injector(provider)
+    errors = []
+
+    def run():
+        try:
+            injector.inject('connection')
+        except Injector.AlreadyClosedError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert connection_started.wait(timeout=5)
+    injector.close()
+    injector_closed.set()
+    thread.join()
+
+    assert len(errors) == 1
+    assert teardown == ['connection']
+
+
+def test_threads_injecting_same_key_wait_for_the_one_creating_it():
+
+    def make_slow():
+        nonlocal count
+        count += 1
+        slow_started.set()
+        time.sleep(0.05)
+        return object()
+
+    count = 0
+    slow_started = threading.Event()
+    provider = Provider()
+    provider.register_func('slow', make_slow)
+    injector = Injector(provider)
+    result = []
+
+    first = threading.Thread(
+        target=lambda: result.append(injector.inject('slow'))
+    )
+    first.start()
+    assert slow_started.wait(timeout=5)
+    result.append(injector.inject('slow'))
+    first.join()
+
+    assert count == 1
+    assert result[0] is result[1]
@@ -48,6 +48,11 @@ class TestGeneratorFactory:
         self.uut.close()
         assert self.uut.get_instance() is None
 
+    def test_generator_is_not_created_until_instance_is_requested(self):
+        with satisfied(self.database):
+            self.uut = factories.GeneratorFactory(self.make_connection)
+            self.uut.close()
+
 
 class TestAsyncGeneratorFactory:
 
@@ -142,3 +147,14 @@ class TestInstanceFactory:
     def test_get_instance_returns_none_after_close(self):
         self.uut.close()
         assert self.uut.get_instance() is None
+
+
+class TestSharedInstanceFactory:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.uut = factories.SharedInstanceFactory([42])
+
+    def test_get_instance_still_returns_value_after_close(self):
+        self.uut.close()
+        assert self.uut.get_instance() == [42]
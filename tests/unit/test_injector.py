@@ -8,10 +8,13 @@
 #
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
+import asyncio
+
 import pytest
 from mockify.actions import Return
 from mockify.mock import ABCMock
 
+from pydio import exc
 from pydio.base import IUnboundFactoryRegistry
 from pydio.injector import Injector
 
@@ -30,6 +33,11 @@ class TestInjectorErrors:
             uut
         ) == "Cannot inject 'foo' due to scope mismatch: 'second' (required) != 'first' (owned)"
 
+    def test_error_classes_are_available_as_injector_attributes(self):
+        assert Injector.NoProviderFoundError is exc.NoProviderFoundError
+        assert Injector.OutOfScopeError is exc.OutOfScopeError
+        assert Injector.AlreadyClosedError is exc.AlreadyClosedError
+
 
 class TestInjector:
 
@@ -69,6 +77,10 @@ class TestInjector:
         assert other.env == 'testing'
         assert uut.env is None
 
+    def test_scoped_injector_can_be_created_with_falsy_env(self, uut):
+        app = uut.scoped('app', env=0)
+        assert app.env == 0
+
     def test_when_injector_is_closed_then_child_injectors_are_closed_as_well(
         self, uut, provider
     ):
@@ -87,3 +99,26 @@ class TestInjector:
         await uut.close()
         assert uut.is_closed()
         assert app.is_closed()
+
+    def test_closing_unused_injector_does_not_return_awaitable(
+        self, uut, provider
+    ):
+        provider.has_awaitables.expect_call().will_once(Return(False))
+        assert uut.close() is None
+        assert uut.is_closed()
+
+    @pytest.mark.asyncio
+    async def test_closing_unused_injector_using_async_provider_returns_awaitable(
+        self, uut, provider
+    ):
+        provider.has_awaitables.expect_call().will_once(Return(True))
+        await asyncio.create_task(uut.close())
+        assert uut.is_closed()
+
+    def test_failed_injection_does_not_leave_key_marked_as_pending(
+        self, uut, provider
+    ):
+        provider.get.expect_call('foo', None).will_once(Return(None))
+        with pytest.raises(Injector.NoProviderFoundError):
+            uut.inject('foo')
+        assert not uut._pending  # pylint: disable=protected-access
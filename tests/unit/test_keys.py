@@ -8,6 +8,10 @@
 #
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
+import collections.abc
+
+import pytest
+
 from pydio.keys import Variant
 
 
@@ -24,3 +28,21 @@ class TestVariant:
         assert Variant('foo') != Variant('foo', a=1)
         assert Variant('foo', a=1) == Variant('foo', a=1)
         assert Variant('foo') != Variant('bar')
+
+    def test_variants_equal_regardless_of_kwargs_order_have_same_hash(self):
+        assert hash(Variant('foo', a=1, b=2)) == hash(Variant('foo', b=2, a=1))
+
+    def test_variant_is_hashable(self):
+        assert isinstance(Variant('foo'), collections.abc.Hashable)
+
+    def test_variant_is_not_equal_to_wrapped_key(self):
+        assert Variant('foo') != 'foo'
+        assert 'foo' != Variant('foo')
+
+    def test_variant_keeps_params_it_was_created_with(self):
+        assert Variant('foo', a=1) == Variant('foo', a=True)
+        assert Variant('foo', a=True).kwargs['a'] is True
+
+    def test_variant_params_must_be_hashable(self):
+        with pytest.raises(TypeError):
+            Variant('foo', a=[1])
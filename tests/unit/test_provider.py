@@ -8,6 +8,9 @@
 #
 # See LICENSE.txt for details.
 # ---------------------------------------------------------------------------
+import gc
+import weakref
+
 import pytest
 from mockify.core import satisfied
 from mockify.mock import ABCMock
@@ -63,3 +66,66 @@ class TestProvider:
         uut.register_func('foo', self.factory_function)
         with pytest.raises(Provider.DoubleRegistrationError):
             uut.register_instance('foo', 123)
+
+    def test_get_returns_factory_registered_after_previous_failed_lookup(
+        self, uut, injector
+    ):
+        assert uut.get('foo') is None
+        uut.register_instance('foo', 123)
+        assert uut.get('foo').bind(injector).get_instance() == 123
+
+    def test_get_does_not_keep_keys_that_were_not_found(self, uut):
+
+        class Key:
+            pass
+
+        key = Key()
+        key_ref = weakref.ref(key)
+        assert uut.get(key) is None
+        del key
+        gc.collect()
+        assert key_ref() is None
+
+    def test_get_falls_back_to_default_env_if_no_env_specific_factory_found(
+        self, uut, injector
+    ):
+        uut.register_instance('foo', 123)
+        assert uut.get('foo', 'testing').bind(injector).get_instance() == 123
+        uut.register_instance('foo', 456, env='testing')
+        assert uut.get('foo', 'testing').bind(injector).get_instance() == 456
+
+    def test_failed_attach_does_not_leave_outdated_lookups(self, uut, injector):
+        uut.register_instance('foo', 123)
+        uut.register_instance('bar', 1)
+        assert uut.get('foo', 'testing').bind(injector).get_instance() == 123
+        other = Provider()
+        other.register_instance('foo', 456, env='testing')
+        other.register_instance('bar', 2)
+        with pytest.raises(Provider.DoubleRegistrationError):
+            uut.attach(other)
+        assert uut.get('foo', 'testing').bind(injector).get_instance() == 456
+
+    def test_provider_has_awaitables_if_awaitable_factory_was_registered(
+        self, uut
+    ):
+
+        async def make_foo():
+            return 'foo'
+
+        assert not uut.has_awaitables()
+        uut.register_func('foo', self.factory_function)
+        assert not uut.has_awaitables()
+        uut.register_func('bar', make_foo)
+        assert uut.has_awaitables()
+
+    def test_provider_has_awaitables_if_attached_provider_has_awaitables(
+        self, uut
+    ):
+
+        async def make_foo():
+            return 'foo'
+
+        other = Provider()
+        other.register_func('foo', make_foo)
+        uut.attach(other)
+        assert uut.has_awaitables()
@@ -0,0 +1,125 @@
+# ---------------------------------------------------------------------------
+# tests/unit/test_unbound_factories.py
+#
+# Copyright (C) 2021 - 2023 Maciej Wiatrzyk <maciej.wiatrzyk@gmail.com>
+#
+# This file is part of PyDio library and is released under the terms of the
+# MIT license: http://opensource.org/licenses/mit-license.php.
+#
+# See LICENSE.txt for details.
+# ---------------------------------------------------------------------------
+import functools
+
+import pytest
+from mockify.mock import ABCMock
+
+from pydio import _unbound_factories as unbound_factories
+from pydio.base import IInjector
+
+
+class TestUnboundFunctionFactory:
+
+    @pytest.fixture
+    def injector(self):
+        return ABCMock('injector', IInjector)
+
+    def test_factory_function_without_params_is_called_without_args(
+        self, injector
+    ):
+        uut = unbound_factories.UnboundFunctionFactory(lambda: 123, 'foo')
+        assert uut.bind(injector).get_instance() == 123
+
+    def test_factory_function_receives_only_params_it_declares(self, injector):
+
+        def make_object(env, key):
+            return key, env
+
+        uut = unbound_factories.UnboundFunctionFactory(
+            make_object, 'foo', env='testing'
+        )
+        assert uut.bind(injector).get_instance() == ('foo', 'testing')
+
+    def test_factory_function_can_receive_all_params(self, injector):
+
+        def make_object(injector, key, env):
+            return injector, key, env
+
+        uut = unbound_factories.UnboundFunctionFactory(make_object, 'foo')
+        assert uut.bind(injector).get_instance() == (injector, 'foo', None)
+
+    def test_factory_function_can_receive_params_in_any_order(self, injector):
+
+        def make_object(key, injector, env):
+            return injector, key, env
+
+        uut = unbound_factories.UnboundFunctionFactory(
+            make_object, 'foo', env='testing'
+        )
+        assert uut.bind(injector).get_instance() == (injector, 'foo', 'testing')
+
+    def test_factory_function_can_receive_params_as_keyword_only_args(
+        self, injector
+    ):
+
+        def make_object(*, injector, key):
+            return injector, key
+
+        uut = unbound_factories.UnboundFunctionFactory(make_object, 'foo')
+        assert uut.bind(injector).get_instance() == (injector, 'foo')
+
+    def test_factory_function_can_receive_injector_only(self, injector):
+
+        def make_object(injector):
+            return injector
+
+        uut = unbound_factories.UnboundFunctionFactory(make_object, 'foo')
+        assert uut.bind(injector).get_instance() is injector
+
+    def test_unhashable_callable_can_be_used_as_factory(self, injector):
+
+        class UnhashableFactory(dict):
+
+            def __call__(self):
+                return 123
+
+        uut = unbound_factories.UnboundFunctionFactory(
+            UnhashableFactory(), 'foo'
+        )
+        assert uut.bind(injector).get_instance() == 123
+
+    def test_awaitable_factories_are_detected(self):
+
+        async def make_coroutine():
+            return 1
+
+        async def make_async_generator():
+            yield 1
+
+        def make_generator():
+            yield 1
+
+        for func, expected in [
+            (make_coroutine, True),
+            (make_async_generator, True),
+            (make_generator, False),
+            (lambda: 1, False),
+            (functools.partial(make_coroutine), True),
+        ]:
+            uut = unbound_factories.UnboundFunctionFactory(func, 'foo')
+            assert uut.is_awaitable() is expected
+
+
+class TestUnboundInstanceFactory:
+
+    @pytest.fixture
+    def injector(self):
+        return ABCMock('injector', IInjector)
+
+    def test_closing_factory_bound_to_one_injector_does_not_affect_others(
+        self, injector
+    ):
+        uut = unbound_factories.UnboundInstanceFactory([42])
+        first = uut.bind(injector)
+        second = uut.bind(injector)
+        first.close()
+        assert second.get_instance() == [42]